@@ -12,7 +12,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('quotes.txt', '.')],  # Include quotes.txt in the build
-    hiddenimports=[
+    hiddenimports=[  # Screensaver modules are imported lazily, so list them all here
         'screensaver_base',
         'color_wheel_screensaver',
         'inspirational_quotes_screensaver',
@@ -2,8 +2,43 @@
 Color Wheel Screensaver - displays a solid color that rotates through the color wheel.
 """
 
-import colorsys
-from screensaver_base import ScreensaverBase, ScreensaverRegistry
+from screensaver_base import CHANNEL_HEX, ScreensaverBase, ScreensaverRegistry
+
+
+def _hue_to_rgb(hue):
+    """
+    Convert a fully saturated, full brightness hue to RGB without branching.
+
+    Args:
+        hue: Hue from 0.0 to 1.0
+
+    Returns:
+        Tuple of (r, g, b) components from 0.0 to 1.0
+    """
+    # With saturation and value both 1, HSV to RGB reduces to three clamped ramps
+    h6 = hue * 6.0
+    r = max(0.0, min(1.0, abs(h6 - 3.0) - 1.0))
+    g = max(0.0, min(1.0, 2.0 - abs(h6 - 2.0)))
+    b = max(0.0, min(1.0, 2.0 - abs(h6 - 4.0)))
+    return r, g, b
+
+
+def _build_wheel(steps):
+    """
+    Precompute the hex color for each of a number of evenly spaced hues.
+
+    Args:
+        steps: Number of colors around the wheel
+
+    Returns:
+        List of Tk color strings, starting at red
+    """
+    wheel = []
+    for i in range(steps):
+        r, g, b = _hue_to_rgb(i / steps)
+        wheel.append("#" + CHANNEL_HEX[int(r * 255)] + CHANNEL_HEX[int(g * 255)]
+                     + CHANNEL_HEX[int(b * 255)])
+    return wheel
 
 
 @ScreensaverRegistry.register
@@ -13,50 +48,42 @@ class ColorWheelScreensaver(ScreensaverBase):
     continuously cycling through the HSV color wheel.
     """
 
+    WHEEL_STEPS = 360  # Number of precomputed colors around the wheel
+    _WHEEL = _build_wheel(WHEEL_STEPS)  # Shared by all instances
+
     def __init__(self, canvas):
         super().__init__(canvas)
         self.hue = 0.0  # Start at red (0 degrees on color wheel)
         self.hue_speed = 0.001  # Speed of color rotation (adjust for faster/slower)
-        self.color_rect = None  # Reusable rectangle object
+        self.original_bg = None  # Canvas background to restore on cleanup
 
-    def get_name(self) -> str:
+    @classmethod
+    def get_name(cls) -> str:
         return "Color Wheel"
 
     def render(self):
-        """Render the current color using a reusable rectangle object."""
+        """Render the current color by setting the canvas background."""
         if not self.canvas:
             return
 
-        # Convert HSV to RGB
-        # HSV: Hue (0-1), Saturation (1 = full color), Value (1 = full brightness)
-        rgb = colorsys.hsv_to_rgb(self.hue, 1.0, 1.0)
-
-        # Convert to hex color for Tkinter
-        r = int(rgb[0] * 255)
-        g = int(rgb[1] * 255)
-        b = int(rgb[2] * 255)
-        color = f"#{r:02x}{g:02x}{b:02x}"
-
-        try:
-            # Get canvas dimensions
-            width = self.canvas.winfo_width()
-            height = self.canvas.winfo_height()
-
-            # Create rectangle on first render, reuse it afterwards
-            if self.color_rect is None:
-                self.color_rect = self.canvas.create_rectangle(
-                    0, 0, width, height,
-                    fill=color,
-                    outline=color,
-                    tags="color_bg"
-                )
-            else:
-                # Just update the color of existing rectangle
-                self.canvas.itemconfig(self.color_rect, fill=color, outline=color)
-                # Update coordinates in case window was resized
-                self.canvas.coords(self.color_rect, 0, 0, width, height)
-        except:
-            pass  # Canvas may not be fully initialized yet
+        # Look up the precomputed color for the current hue
+        color = self._WHEEL[int(self.hue * self.WHEEL_STEPS) % self.WHEEL_STEPS]
+
+        # Fill via the canvas background rather than a full-size rectangle item,
+        # so there is no item to rasterize or outline and resizes need no handling
+        if self.original_bg is None:
+            self.original_bg = self.canvas.cget("bg")
+        self.canvas.configure(bg=color)
 
         # Increment hue for next frame and wrap around
         self.hue = (self.hue + self.hue_speed) % 1.0
+
+    def stop(self):
+        """Stop the animation and restore the canvas background."""
+        # The background is all this screensaver draws, so it is restored here
+        # rather than in destroy(); a screensaver started next then sees the
+        # original background instead of the last wheel color
+        if self.original_bg is not None:
+            self.canvas.configure(bg=self.original_bg)
+            self.original_bg = None
+        super().stop()
@@ -5,7 +5,87 @@ Inspirational Quotes Screensaver - displays inspirational quotes with fade in/ou
 import random
 import os
 import math
-from screensaver_base import ScreensaverBase, ScreensaverRegistry
+from tkinter import font as tkfont
+from screensaver_base import CHANNEL_HEX, ScreensaverBase, ScreensaverRegistry
+
+
+# Gray color strings for every intensity, from black (0) to white (255)
+_GRAYSCALE_LUT = ["#" + h + h + h for h in CHANNEL_HEX]
+
+# Parsed quotes shared by all instances, loaded on first use
+_QUOTES_CACHE = None
+
+
+def _parse_quotes_file():
+    """
+    Parse quotes.txt into a list of (quote, author) tuples.
+
+    Returns:
+        List of quote tuples, or fallback quotes if the file is missing or unreadable
+    """
+    quotes_file = os.path.join(os.path.dirname(__file__), "quotes.txt")
+
+    if not os.path.exists(quotes_file):
+        # Fallback quotes if file doesn't exist
+        return [
+            ("The only way to do great work is to love what you do.", "Steve Jobs"),
+            ("Believe you can and you're halfway there.", "Theodore Roosevelt"),
+            ("Success is not final, failure is not fatal.", "Winston Churchill"),
+        ]
+
+    try:
+        with open(quotes_file, 'r', encoding='utf-8') as f:
+            data = f.read()
+
+        # Parse the whole file in one pass; lines without a separator are skipped
+        return [
+            (quote.strip(), author.strip())
+            for quote, author in (line.split('|', 1) for line in data.splitlines() if '|' in line)
+        ]
+    except Exception as e:
+        print(f"Error loading quotes: {e}")
+        # Use fallback quotes
+        return [
+            ("The only way to do great work is to love what you do.", "Steve Jobs"),
+            ("Believe you can and you're halfway there.", "Theodore Roosevelt"),
+        ]
+
+
+def _load_quotes_cached():
+    """
+    Get the parsed quotes, reading quotes.txt only the first time.
+
+    Returns:
+        A new list of quote tuples that the caller is free to shuffle
+    """
+    global _QUOTES_CACHE
+    if _QUOTES_CACHE is None:
+        _QUOTES_CACHE = _parse_quotes_file()
+    return list(_QUOTES_CACHE)
+
+
+def _build_fade_colors(fade_steps, shadow_intensity):
+    """
+    Precompute text and shadow colors for every fade step using integer math.
+
+    Args:
+        fade_steps: Number of steps from hidden to fully visible
+        shadow_intensity: Shadow brightness relative to the text, out of 256
+
+    Returns:
+        Tuple of (text colors, shadow colors, first step where the shadow isn't black)
+    """
+    fade_colors = []
+    shadow_fade_colors = []
+    shadow_min_step = fade_steps + 1
+    for step in range(fade_steps + 1):
+        intensity = (255 * step) // fade_steps
+        shadow = (intensity * shadow_intensity) >> 8
+        fade_colors.append(_GRAYSCALE_LUT[intensity])
+        shadow_fade_colors.append(_GRAYSCALE_LUT[shadow])
+        if shadow > 0:
+            shadow_min_step = min(shadow_min_step, step)
+    return fade_colors, shadow_fade_colors, shadow_min_step
 
 
 @ScreensaverRegistry.register
@@ -21,10 +101,15 @@ class InspirationalQuotesScreensaver(ScreensaverBase):
     DISPLAY_DURATION_PROD = 1800000  # 30 minutes for production
     FADE_DURATION = 2000  # 2 seconds for fade in/out
     FADE_STEPS = 60  # Number of steps in fade animation (smoother with more steps)
+    SHADOW_INTENSITY = 38  # Shadow brightness relative to the text, out of 256 (about 15%)
+
+    # Colors for every fade step, shared by all instances
+    _FADE_COLORS, _SHADOW_FADE_COLORS, _SHADOW_MIN_STEP = _build_fade_colors(FADE_STEPS, SHADOW_INTENSITY)
 
     # Animation configuration
     DRIFT_SPEED_BASE = 0.05  # Base pixels per frame for horizontal drift (extremely subtle)
     SHADOW_DRIFT_MULTIPLIER = 0.7  # Shadow drifts at 70% speed of main text
+    HOLD_FRAME_DELAY = 500  # Frame delay while a quote is fully displayed (drift moves ~1 pixel per frame)
     RANDOM_START_RANGE = 100  # Random offset range for starting position (pixels)
 
     def __init__(self, canvas, use_test_timing=False):
@@ -39,14 +124,16 @@ class InspirationalQuotesScreensaver(ScreensaverBase):
         self.quotes = []
         self.current_quote = None
         self.current_author = None
-        self.last_quote_tuple = None  # Track last quote to prevent duplicates
-        self.quote_text_id = None
-        self.author_text_id = None
+        self.current_text = None  # Quote and author combined for display
+        self.last_quote_index = None  # Track last quote to prevent duplicates
+        self.quote_text_id = None  # Quote and author share one text item
         self.shadow_quote_id = None  # Background shadow text
         self.shadow_author_id = None
-        self.current_alpha = 0.0  # Current opacity (0.0 to 1.0)
+        self._shadow_visible = False  # Whether the shadow item is currently shown
+        self._last_color = None  # Fill last applied to the quote text
+        self._last_shadow_color = None  # Fill last applied to the shadow text
         self.fade_state = "idle"  # States: idle, fading_in, displaying, fading_out
-        self.fade_step = 0
+        self.fade_step = 0  # Current opacity as a step count (0 = hidden, FADE_STEPS = fully visible)
         self.display_timer_id = None
         self.use_test_timing = use_test_timing
 
@@ -59,6 +146,14 @@ class InspirationalQuotesScreensaver(ScreensaverBase):
         self.random_start_x = 0  # Random horizontal start offset
         self.random_start_y = 0  # Random vertical start offset
 
+        # Layout state, recomputed only when the canvas is resized
+        self._quote_font = None
+        self._shadow_font = None
+        self._quote_wrap_width = 0
+        self._shadow_wrap_width = 0
+        self._ready = False  # Set once the canvas is mapped and has a real size
+        self._map_bind = None  # Tcl command id of the <Map> binding
+
         # Load quotes from file
         self._load_quotes()
 
@@ -66,38 +161,13 @@ class InspirationalQuotesScreensaver(ScreensaverBase):
         if self.quotes:
             self._select_random_quote()
 
-    def get_name(self) -> str:
+    @classmethod
+    def get_name(cls) -> str:
         return "Inspirational Quotes"
 
     def _load_quotes(self):
         """Load quotes from quotes.txt file."""
-        quotes_file = os.path.join(os.path.dirname(__file__), "quotes.txt")
-
-        if not os.path.exists(quotes_file):
-            # Fallback quotes if file doesn't exist
-            self.quotes = [
-                ("The only way to do great work is to love what you do.", "Steve Jobs"),
-                ("Believe you can and you're halfway there.", "Theodore Roosevelt"),
-                ("Success is not final, failure is not fatal.", "Winston Churchill"),
-            ]
-            return
-
-        try:
-            with open(quotes_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and '|' in line:
-                        parts = line.split('|', 1)
-                        if len(parts) == 2:
-                            quote, author = parts
-                            self.quotes.append((quote.strip(), author.strip()))
-        except Exception as e:
-            print(f"Error loading quotes: {e}")
-            # Use fallback quotes
-            self.quotes = [
-                ("The only way to do great work is to love what you do.", "Steve Jobs"),
-                ("Believe you can and you're halfway there.", "Theodore Roosevelt"),
-            ]
+        self.quotes = _load_quotes_cached()
 
         # Shuffle quotes for random order
         random.shuffle(self.quotes)
@@ -107,149 +177,156 @@ class InspirationalQuotesScreensaver(ScreensaverBase):
         if not self.quotes:
             return
 
-        # If we only have one quote, just use it
-        if len(self.quotes) == 1:
-            quote, author = self.quotes[0]
-            self.current_quote = quote
-            self.current_author = f"— {author}"
-            self.last_quote_tuple = self.quotes[0]
+        count = len(self.quotes)
+        if count == 1:
+            # If we only have one quote, just use it
+            index = 0
+        elif self.last_quote_index is None:
+            index = random.randrange(count)
+        else:
+            # Pick among the other quotes by skipping over the last one's slot
+            index = random.randrange(count - 1)
+            if index >= self.last_quote_index:
+                index += 1
+
+        quote, author = self.quotes[index]
+        self.current_quote = quote
+        self.current_author = f"— {author}"
+        self.current_text = f"{self.current_quote}\n\n{self.current_author}"
+        self.last_quote_index = index
+
+    def _update_layout(self):
+        """Recompute the fonts and wrap widths for the cached canvas size."""
+        width = self._width
+
+        # Calculate font size based on canvas size
+        quote_font_size = max(20, min(36, width // 30))
+        shadow_font_size = int(quote_font_size * 1.8)  # Shadow is larger
+
+        # Named fonts are created once and resized in place; Tk re-lays out
+        # every text item using them, so items never need their font reset
+        if self._quote_font is None:
+            self._quote_font = tkfont.Font(root=self.canvas, family="Arial",
+                                           size=quote_font_size, weight="bold")
+            self._shadow_font = tkfont.Font(root=self.canvas, family="Arial",
+                                            size=shadow_font_size, weight="bold")
+        else:
+            self._quote_font.configure(size=quote_font_size)
+            self._shadow_font.configure(size=shadow_font_size)
+
+        self._quote_wrap_width = width * 0.8  # Wrap at 80% of canvas width
+        self._shadow_wrap_width = width * 0.9
+
+    def _on_map(self, event):
+        """Mark the canvas as ready to draw on and pick up its mapped size."""
+        self._ready = True
+        self._on_configure(None)
+
+    def _on_resize(self):
+        """Update the layout, then rewrap and reposition existing text."""
+        self._update_layout()
+
+        if self.quote_text_id is None:
             return
 
-        # Select a quote that's different from the last one
-        selected_quote = random.choice(self.quotes)
+        # Fonts update themselves; only the wrap widths need reapplying
+        self.canvas.itemconfig(self.shadow_quote_id, width=self._shadow_wrap_width)
+        self.canvas.itemconfig(self.quote_text_id, width=self._quote_wrap_width)
 
-        # Keep trying until we get a different quote (max 10 attempts)
-        attempts = 0
-        while selected_quote == self.last_quote_tuple and attempts < 10:
-            selected_quote = random.choice(self.quotes)
-            attempts += 1
+        # Re-center for the new size
+        self._position_text()
 
-        quote, author = selected_quote
-        self.current_quote = quote
-        self.current_author = f"— {author}"
-        self.last_quote_tuple = selected_quote
-
-    def _get_alpha_color(self, alpha):
+    def _get_text_positions(self):
         """
-        Convert alpha value (0.0 to 1.0) to a color string for white text on black background.
-
-        Args:
-            alpha: Opacity from 0.0 (transparent) to 1.0 (fully visible)
+        Calculate the absolute text positions from the layout and drift state.
 
         Returns:
-            Hex color string (gray scale where 0.0 = black, 1.0 = white)
+            Tuple of (center_x, center_y, shadow_center_x, shadow_center_y)
         """
-        # For white text fading in/out, we go from black (0,0,0) to white (255,255,255)
-        intensity = int(255 * alpha)
-        return f"#{intensity:02x}{intensity:02x}{intensity:02x}"
+        # Calculate positions with drift and random starting position
+        center_x = self._width // 2 + self.drift_offset + self.random_start_x
+        center_y = self._height // 2 + self.random_start_y
+
+        # Parallax: shadow drifts at different rate and offset for depth
+        shadow_center_x = self._width // 2 + self.shadow_drift_offset + (self.random_start_x * 0.7)
+        shadow_center_y = self._height // 2 + (self.random_start_y * 0.7)
+
+        return center_x, center_y, shadow_center_x, shadow_center_y
+
+    def _position_text(self):
+        """Move the text items to their absolute positions."""
+        center_x, center_y, shadow_center_x, shadow_center_y = self._get_text_positions()
+        self.canvas.coords(self.shadow_quote_id, shadow_center_x, shadow_center_y)
+        self.canvas.coords(self.quote_text_id, center_x, center_y)
+
+    def _build_items(self):
+        """Create the shadow and quote text items once; each new quote reuses them."""
+        # Background shadow (larger, very faded, drifts opposite direction)
+        self.shadow_quote_id = self._items["shadow"] = self.canvas.create_text(
+            0, 0,
+            text="",
+            font=self._shadow_font,
+            width=self._shadow_wrap_width,
+            justify="center",
+            state="hidden",
+            tags="shadow"
+        )
+
+        # Main quote text with the author on its own line below (centered, with
+        # wrapping, with drift); one item keeps Tk to a single layout and fill update
+        self.quote_text_id = self._items["quote"] = self.canvas.create_text(
+            0, 0,
+            text="",
+            font=self._quote_font,
+            width=self._quote_wrap_width,
+            justify="center",
+            tags="quote"
+        )
+
+    def _show_current_quote(self):
+        """Put the current quote into the text items, starting fully faded out."""
+        if self.quote_text_id is None or not self.current_quote:
+            return
 
-    def _create_or_update_text(self):
-        """Create or update the text items on canvas with smooth drift and parallax animations."""
+        color = self._FADE_COLORS[0]
+        self.canvas.itemconfig(self.shadow_quote_id, text=self.current_quote, state="hidden")
+        self.canvas.itemconfig(self.quote_text_id, text=self.current_text, fill=color)
+        self._shadow_visible = False
+        self._last_shadow_color = None
+        self._last_color = color
+        self._position_text()
+
+    def _update_text_colors(self):
+        """Update the text colors for the current fade step."""
         if not self.canvas or not self.current_quote:
             return
 
-        try:
-            width = self.canvas.winfo_width()
-            height = self.canvas.winfo_height()
-            color = self._get_alpha_color(self.current_alpha)
-            shadow_color = self._get_alpha_color(self.current_alpha * 0.15)  # Very faded shadow
-
-            # Calculate font size based on canvas size
-            quote_font_size = max(20, min(36, width // 30))
-            author_font_size = max(16, min(28, width // 40))
-            shadow_font_size = int(quote_font_size * 1.8)  # Shadow is larger
-
-            # Calculate positions with drift and random starting position
-            center_x = width // 2 + self.drift_offset + self.random_start_x
-            center_y = height // 2 + self.random_start_y
-
-            # Parallax: shadow drifts at different rate and offset for depth
-            shadow_center_x = width // 2 + self.shadow_drift_offset + (self.random_start_x * 0.7)
-            shadow_center_y = height // 2 + (self.random_start_y * 0.7)
-
-            # Create text items if they don't exist
-            if self.quote_text_id is None:
-                # Background shadow (larger, very faded, drifts opposite direction)
-                self.shadow_quote_id = self.canvas.create_text(
-                    shadow_center_x,
-                    shadow_center_y,
-                    text=self.current_quote,
-                    fill=shadow_color,
-                    font=("Arial", shadow_font_size, "bold"),
-                    width=width * 0.9,
-                    justify="center",
-                    tags="shadow"
-                )
-
-                # Main quote text (centered, with wrapping, with drift and wave)
-                self.quote_text_id = self.canvas.create_text(
-                    center_x,
-                    center_y,
-                    text=self.current_quote,
-                    fill=color,
-                    font=("Arial", quote_font_size, "bold"),
-                    width=width * 0.8,  # Wrap at 80% of canvas width
-                    justify="center",
-                    tags="quote"
-                )
-
-                # Get the bounding box of the quote to calculate author position
-                quote_bbox = self.canvas.bbox(self.quote_text_id)
-                if quote_bbox:
-                    # Position author 40 pixels below the bottom of the quote
-                    author_y = quote_bbox[3] + 40
-                else:
-                    # Fallback position
-                    author_y = center_y + 60
-
-                # Author text (below quote)
-                self.author_text_id = self.canvas.create_text(
-                    center_x,
-                    author_y,
-                    text=self.current_author,
-                    fill=color,
-                    font=("Arial", author_font_size, "italic"),
-                    justify="center",
-                    tags="author"
-                )
-            else:
-                # Update shadow with parallax
-                if self.shadow_quote_id:
-                    self.canvas.itemconfig(self.shadow_quote_id,
-                                          fill=shadow_color,
-                                          font=("Arial", shadow_font_size, "bold"),
-                                          width=width * 0.9)
-                    self.canvas.coords(self.shadow_quote_id, shadow_center_x, shadow_center_y)
-
-                # Update existing text color and font (in case of resize)
-                self.canvas.itemconfig(self.quote_text_id,
-                                      fill=color,
-                                      font=("Arial", quote_font_size, "bold"),
-                                      width=width * 0.8)
-                self.canvas.itemconfig(self.author_text_id,
-                                      fill=color,
-                                      font=("Arial", author_font_size, "italic"))
-
-                # Update position with drift and wave
-                self.canvas.coords(self.quote_text_id, center_x, center_y)
-
-                # Recalculate author position based on quote height
-                quote_bbox = self.canvas.bbox(self.quote_text_id)
-                if quote_bbox:
-                    author_y = quote_bbox[3] + 40
-                else:
-                    author_y = center_y + 60
-
-                self.canvas.coords(self.author_text_id, center_x, author_y)
-
-        except Exception as e:
-            pass  # Canvas may not be ready
+        color = self._FADE_COLORS[self.fade_step]
+        shadow_color = self._SHADOW_FADE_COLORS[self.fade_step]  # Very faded shadow
+        # The shadow rounds to black at the ends of a fade, so hide it rather than draw it
+        shadow_visible = self.fade_step >= self._SHADOW_MIN_STEP
+
+        # Colors are only sent to Tk when they differ from the previous frame,
+        # e.g. repeated shadow shades mid-fade or the steady color while displaying
+        if shadow_visible:
+            if not self._shadow_visible:
+                self.canvas.itemconfig(self.shadow_quote_id, fill=shadow_color, state="normal")
+                self._shadow_visible = True
+                self._last_shadow_color = shadow_color
+            elif shadow_color != self._last_shadow_color:
+                self._itemconfig_fill(self.shadow_quote_id, shadow_color)
+                self._last_shadow_color = shadow_color
+        elif self._shadow_visible:
+            self.canvas.itemconfig(self.shadow_quote_id, state="hidden")
+            self._shadow_visible = False
+        if color != self._last_color:
+            self._itemconfig_fill(self.quote_text_id, color)
+            self._last_color = color
 
     def _start_fade_in(self):
         """Start the fade-in animation with random starting position and drift direction."""
         self.fade_state = "fading_in"
         self.fade_step = 0
-        self.current_alpha = 0.0
         # Reset drift to start from center
         self.drift_offset = 0.0
         self.shadow_drift_offset = 0.0
@@ -261,37 +338,34 @@ class InspirationalQuotesScreensaver(ScreensaverBase):
         self.drift_speed = self.DRIFT_SPEED_BASE * drift_direction
         # Shadow drifts opposite direction at 70% speed
         self.shadow_drift_speed = -self.drift_speed * self.SHADOW_DRIFT_MULTIPLIER
+        self._show_current_quote()
 
     def _start_fade_out(self):
         """Start the fade-out animation."""
         self.fade_state = "fading_out"
-        self.fade_step = 0
-        self.current_alpha = 1.0
+        self.fade_step = self.FADE_STEPS
 
     def _update_fade(self):
         """Update the fade animation."""
         if self.fade_state == "fading_in":
-            # Fade in: alpha goes from 0.0 to 1.0
+            # Fade in: step counts up from 0 to FADE_STEPS
             self.fade_step += 1
-            self.current_alpha = min(1.0, self.fade_step / self.FADE_STEPS)
 
             if self.fade_step >= self.FADE_STEPS:
                 # Fade in complete, start display timer
                 self.fade_state = "displaying"
-                self.current_alpha = 1.0
+                self.fade_step = self.FADE_STEPS
                 self._schedule_fade_out()
 
         elif self.fade_state == "fading_out":
-            # Fade out: alpha goes from 1.0 to 0.0
-            self.fade_step += 1
-            self.current_alpha = max(0.0, 1.0 - (self.fade_step / self.FADE_STEPS))
+            # Fade out: step counts down from FADE_STEPS to 0
+            self.fade_step -= 1
 
-            if self.fade_step >= self.FADE_STEPS:
+            if self.fade_step <= 0:
                 # Fade out complete, select new quote and start fade in
                 self.fade_state = "idle"
-                self.current_alpha = 0.0
+                self.fade_step = 0
                 self._select_random_quote()
-                self._delete_text()
                 self._start_fade_in()
 
     def _schedule_fade_out(self):
@@ -302,62 +376,92 @@ class InspirationalQuotesScreensaver(ScreensaverBase):
         display_duration = self.DISPLAY_DURATION_TEST if self.use_test_timing else self.DISPLAY_DURATION_PROD
         self.display_timer_id = self.canvas.after(display_duration, self._start_fade_out)
 
-    def _delete_text(self):
-        """Delete text items from canvas."""
-        if self.shadow_quote_id:
-            self.canvas.delete(self.shadow_quote_id)
-            self.shadow_quote_id = None
-        if self.quote_text_id:
-            self.canvas.delete(self.quote_text_id)
-            self.quote_text_id = None
-        if self.author_text_id:
-            self.canvas.delete(self.author_text_id)
-            self.author_text_id = None
-
-    def _update_animations(self):
-        """Update continuous animations - smooth horizontal drift."""
+    def _update_animations(self, frames=1):
+        """
+        Update continuous animations - smooth horizontal drift.
+
+        Args:
+            frames: Number of base frames elapsed since the last update
+        """
         # Update horizontal drift using randomized speeds (wraps around screen)
-        self.drift_offset += self.drift_speed
-        self.shadow_drift_offset += self.shadow_drift_speed
+        drift = self.drift_speed * frames
+        shadow_drift = self.shadow_drift_speed * frames
+        self.drift_offset += drift
+        self.shadow_drift_offset += shadow_drift
 
         # Wrap drift around screen (prevents it from drifting too far)
-        if self.canvas:
-            width = self.canvas.winfo_width()
-            if abs(self.drift_offset) > width:
-                self.drift_offset = 0
-            if abs(self.shadow_drift_offset) > width:
-                self.shadow_drift_offset = 0
+        wrapped = False
+        if abs(self.drift_offset) > self._width:
+            self.drift_offset = 0
+            wrapped = True
+        if abs(self.shadow_drift_offset) > self._width:
+            self.shadow_drift_offset = 0
+            wrapped = True
+
+        # Shift existing text by this frame's drift; re-center absolutely after a wrap
+        if self.quote_text_id:
+            if wrapped:
+                self._position_text()
+            else:
+                self.canvas.move(self.shadow_quote_id, shadow_drift, 0)
+                self.canvas.move(self.quote_text_id, drift, 0)
 
         # Increment frame counter
-        self.frame_count += 1
+        self.frame_count += frames
+
+    def get_frame_delay(self) -> int:
+        """Render less often while a quote is held on screen and only the slow drift changes."""
+        if self.fade_state == "displaying":
+            return self.HOLD_FRAME_DELAY
+        return self.FRAME_DELAY
 
     def render(self):
         """Render one frame of the screensaver."""
-        if not self.canvas:
+        if not self.canvas or not self._ready:
             return
 
+        # Drift covers all base frames since the last render, so it keeps its speed
+        # when frames are spaced out during the hold
+        frames = self._frame_period_ms // self.FRAME_DELAY
+
         # Update fade animation
         if self.fade_state in ["fading_in", "fading_out"]:
             self._update_fade()
 
         # Update continuous animations (drift, pulse)
         if self.fade_state != "idle":
-            self._update_animations()
+            self._update_animations(frames)
 
-        # Create or update text with current alpha and animation state
+        # Update text colors with current fade state
         if self.fade_state != "idle":
-            self._create_or_update_text()
+            self._update_text_colors()
 
     def start(self):
         """Start the screensaver animation."""
+        # Don't draw until the canvas is on screen (the preview canvas already is)
+        self._ready = bool(self.canvas.winfo_ismapped())
+        self._map_bind = self.canvas.bind("<Map>", self._on_map)
+
+        # A restarted instance still shows its last quote; move on to a new one
+        if self.quote_text_id is not None:
+            self._select_random_quote()
+
         super().start()
         if self.quotes:
             self._start_fade_in()
 
-    def cleanup(self):
-        """Clean up resources."""
+    def stop(self):
+        """Stop the animation and release the canvas event bindings."""
         if self.display_timer_id:
             self.canvas.after_cancel(self.display_timer_id)
             self.display_timer_id = None
-        self._delete_text()
-        super().cleanup()
+        if self._map_bind:
+            self.canvas.unbind("<Map>", self._map_bind)
+            self._map_bind = None
+        super().stop()
+
+    def destroy(self):
+        """Delete the quote text items."""
+        super().destroy()
+        self.quote_text_id = None
+        self.shadow_quote_id = None
@@ -5,9 +5,16 @@ Main application window for the screensaver selector and preview.
 import tkinter as tk
 from tkinter import ttk
 from screensaver_base import ScreensaverRegistry
-# Import all screensaver implementations to register them
-import color_wheel_screensaver
-import inspirational_quotes_screensaver
+
+# Available screensavers as (display name, module) pairs. Each module is only
+# imported when its screensaver is first selected.
+SCREENSAVER_MODULES = [
+    ("Color Wheel", "color_wheel_screensaver"),
+    ("Inspirational Quotes", "inspirational_quotes_screensaver"),
+]
+
+for _name, _module in SCREENSAVER_MODULES:
+    ScreensaverRegistry.register_lazy(_name, _module)
 
 
 class ScreensaverApp:
@@ -22,16 +29,22 @@ class ScreensaverApp:
 
         # Current screensaver instance
         self.current_screensaver = None
+
+        # Fullscreen widgets are created on first launch, then hidden and reused
         self.fullscreen_window = None
+        self.fullscreen_canvas = None
+        self.fullscreen_screensaver = None
+        self.info_label = None
+        self._info_label_timer = None
 
-        # Get all registered screensavers
-        self.screensaver_classes = ScreensaverRegistry.get_all()
+        # Get all registered screensaver names (modules load on selection)
+        self.screensaver_names = ScreensaverRegistry.get_names()
 
         # Setup UI
         self._create_ui()
 
         # Select first screensaver by default
-        if self.screensaver_classes:
+        if self.screensaver_names:
             self.screensaver_selector.current(0)
             self._on_screensaver_change(None)
 
@@ -44,10 +57,9 @@ class ScreensaverApp:
         # Screensaver selector dropdown
         ttk.Label(control_frame, text="Select Screensaver:").pack(side=tk.LEFT, padx=(0, 10))
 
-        screensaver_names = [cls(None).get_name() for cls in self.screensaver_classes]
         self.screensaver_selector = ttk.Combobox(
             control_frame,
-            values=screensaver_names,
+            values=self.screensaver_names,
             state="readonly",
             width=30
         )
@@ -79,14 +91,16 @@ class ScreensaverApp:
 
     def _on_screensaver_change(self, event):
         """Handle screensaver selection change."""
-        # Stop and cleanup current screensaver
-        if self.current_screensaver:
-            self.current_screensaver.cleanup()
+        # Stop the current screensaver but keep its items on the canvas until
+        # the new one has drawn, so the preview never shows an empty frame
+        previous = self.current_screensaver
+        if previous:
+            previous.stop()
 
         # Get selected screensaver class
         selected_index = self.screensaver_selector.current()
         if selected_index >= 0:
-            screensaver_class = self.screensaver_classes[selected_index]
+            screensaver_class = ScreensaverRegistry.get(self.screensaver_names[selected_index])
 
             # Create new instance with preview canvas
             self.current_screensaver = screensaver_class(self.preview_canvas)
@@ -94,6 +108,38 @@ class ScreensaverApp:
             # Start preview animation
             self.current_screensaver.start()
 
+        if previous:
+            previous.destroy()
+
+    def _create_fullscreen_window(self):
+        """Create the fullscreen window, its canvas and the exit hint."""
+        self.fullscreen_window = tk.Toplevel(self.root)
+        self.fullscreen_window.configure(bg="black")
+        self.fullscreen_window.protocol("WM_DELETE_WINDOW", self._exit_fullscreen)
+
+        # Create canvas for fullscreen screensaver
+        self.fullscreen_canvas = tk.Canvas(
+            self.fullscreen_window,
+            bg="black",
+            highlightthickness=0
+        )
+        self.fullscreen_canvas.pack(fill=tk.BOTH, expand=True)
+
+        # Bind escape key to exit fullscreen
+        self.fullscreen_window.bind("<Escape>", self._exit_fullscreen)
+        self.fullscreen_window.bind("<Button-1>", self._exit_fullscreen)  # Click to exit
+        self.fullscreen_canvas.bind("<Escape>", self._exit_fullscreen)
+        self.fullscreen_canvas.bind("<Button-1>", self._exit_fullscreen)
+
+        # Instruction label, shown for a few seconds on each launch
+        self.info_label = tk.Label(
+            self.fullscreen_window,
+            text="Press ESC or click to exit",
+            fg="white",
+            bg="black",
+            font=("Arial", 12)
+        )
+
     def _start_fullscreen(self):
         """Launch the selected screensaver in fullscreen mode."""
         if not self.current_screensaver:
@@ -109,8 +155,12 @@ class ScreensaverApp:
         center_x = main_x + main_width // 2
         center_y = main_y + main_height // 2
 
-        # Create fullscreen window
-        self.fullscreen_window = tk.Toplevel(self.root)
+        # The window is kept between launches and only shown again, so widget
+        # creation is paid once
+        if self.fullscreen_window is None:
+            self._create_fullscreen_window()
+        else:
+            self.fullscreen_window.deiconify()
 
         # Position the window at the center of the main window's monitor before going fullscreen
         # This ensures it goes fullscreen on the correct monitor
@@ -119,50 +169,41 @@ class ScreensaverApp:
 
         # Now set fullscreen - it will expand on the monitor where it's positioned
         self.fullscreen_window.attributes("-fullscreen", True)
-        self.fullscreen_window.configure(bg="black")
-
-        # Create canvas for fullscreen screensaver
-        fullscreen_canvas = tk.Canvas(
-            self.fullscreen_window,
-            bg="black",
-            highlightthickness=0
-        )
-        fullscreen_canvas.pack(fill=tk.BOTH, expand=True)
 
-        # Create new instance of selected screensaver for fullscreen
-        selected_index = self.screensaver_selector.current()
-        screensaver_class = self.screensaver_classes[selected_index]
-        fullscreen_screensaver = screensaver_class(fullscreen_canvas)
+        # Reuse the fullscreen screensaver and its canvas items if the same one is
+        # still selected, otherwise replace it with an instance of the previewed one
+        # (Tk canvases can't be reparented, so the preview instance can't be reused)
+        screensaver_class = type(self.current_screensaver)
+        if type(self.fullscreen_screensaver) is not screensaver_class:
+            if self.fullscreen_screensaver:
+                self.fullscreen_screensaver.destroy()
+            self.fullscreen_screensaver = screensaver_class(self.fullscreen_canvas)
 
         # Start fullscreen screensaver
-        fullscreen_screensaver.start()
-
-        # Bind escape key to exit fullscreen
-        def exit_fullscreen(event=None):
-            fullscreen_screensaver.cleanup()
-            self.fullscreen_window.destroy()
-            self.fullscreen_window = None
-
-        self.fullscreen_window.bind("<Escape>", exit_fullscreen)
-        self.fullscreen_window.bind("<Button-1>", exit_fullscreen)  # Click to exit
-        fullscreen_canvas.bind("<Escape>", exit_fullscreen)
-        fullscreen_canvas.bind("<Button-1>", exit_fullscreen)
+        self.fullscreen_screensaver.start()
 
         # Set focus to the canvas so key events are captured
-        fullscreen_canvas.focus_set()
+        self.fullscreen_canvas.focus_set()
 
         # Show instruction label
-        info_label = tk.Label(
-            self.fullscreen_window,
-            text="Press ESC or click to exit",
-            fg="white",
-            bg="black",
-            font=("Arial", 12)
-        )
-        info_label.place(relx=0.5, rely=0.95, anchor=tk.CENTER)
+        self.info_label.place(relx=0.5, rely=0.95, anchor=tk.CENTER)
+
+        # Hide instruction after 3 seconds; unplacing only redraws the label's area,
+        # where destroying it would relayout the whole fullscreen window
+        if self._info_label_timer:
+            self.fullscreen_window.after_cancel(self._info_label_timer)
+        self._info_label_timer = self.fullscreen_window.after(3000, self.info_label.place_forget)
+
+    def _exit_fullscreen(self, event=None):
+        """Stop the fullscreen screensaver and hide its window for the next launch."""
+        # Events reach both the canvas and window bindings, so this can run twice
+        if not self.fullscreen_screensaver or not self.fullscreen_screensaver.is_running:
+            return
 
-        # Fade out instruction after 3 seconds
-        self.fullscreen_window.after(3000, info_label.destroy)
+        self.fullscreen_screensaver.stop()
+        # Leave fullscreen before hiding, so the next launch can pick its monitor again
+        self.fullscreen_window.attributes("-fullscreen", False)
+        self.fullscreen_window.withdraw()
 
     def run(self):
         """Start the application main loop."""
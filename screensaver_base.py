@@ -4,8 +4,53 @@ All screensaver implementations should inherit from this class.
 """
 
 from abc import ABC, abstractmethod
+import importlib
+import time
 import tkinter as tk
 
+# Two-digit hex strings for every 0-255 channel value, for building Tk colors
+CHANNEL_HEX = [f"{i:02x}" for i in range(256)]
+
+
+class _Ticker:
+    """
+    Pending after() callback of an animation loop.
+
+    Holds the canvas timer methods pre-bound and the id of the scheduled
+    callback, so the loop reschedules itself without extra lookups and
+    stopping it is a single cancel.
+    """
+
+    __slots__ = ("after", "after_idle", "after_cancel", "callback", "id")
+
+    def __init__(self, canvas, callback):
+        self.after = canvas.after
+        self.after_idle = canvas.after_idle
+        self.after_cancel = canvas.after_cancel
+        self.callback = callback
+        self.id = None
+
+    def schedule(self, delay):
+        """
+        Run the callback after a delay, or once Tk is idle if the delay is under 1 ms.
+
+        Args:
+            delay: Delay in milliseconds
+        """
+        if delay < 1:
+            self.id = self.after_idle(self.callback)
+        else:
+            self.id = self.after(delay, self.callback)
+
+    def cancel(self):
+        """Cancel the pending callback, if any."""
+        if self.id:
+            try:
+                self.after_cancel(self.id)
+            except tk.TclError:
+                pass  # The canvas was already destroyed along with its timers
+            self.id = None
+
 
 class ScreensaverBase(ABC):
     """
@@ -15,6 +60,9 @@ class ScreensaverBase(ABC):
     on the provided canvas.
     """
 
+    FRAME_DELAY = 25  # Milliseconds between frames (approximately 40 FPS)
+    MAX_FRAMES_BEHIND = 2  # Frames the loop may fall behind before it stops catching up
+
     def __init__(self, canvas: tk.Canvas):
         """
         Initialize the screensaver with a canvas to draw on.
@@ -24,10 +72,19 @@ class ScreensaverBase(ABC):
         """
         self.canvas = canvas
         self.is_running = False
-        self.animation_id = None
+        self._ticker = None  # Animation timer, created by start()
+        self._items = {}  # Persistent canvas item ids, keyed by role
+        self._width = None  # Canvas size, cached from <Configure> events while running
+        self._height = None
+        self._next_tick_ns = None  # perf_counter_ns() deadline of the current frame
+        self._frame_period_ms = self.FRAME_DELAY  # Delay scheduled before the current frame
+        self._tk_call = None  # Bound Tcl command dispatcher, cached by start()
+        self._cw = None  # Tcl path name of the canvas, cached by start()
+        self._configure_bind = None  # Tcl command id of the <Configure> binding
 
+    @classmethod
     @abstractmethod
-    def get_name(self) -> str:
+    def get_name(cls) -> str:
         """
         Return the display name of this screensaver.
 
@@ -44,64 +101,241 @@ class ScreensaverBase(ABC):
         """
         pass
 
+    def get_frame_delay(self) -> int:
+        """
+        Return the delay before the next frame is rendered.
+
+        Screensavers can override this to render less often while nothing
+        on screen is changing quickly. It should only read state; the delay
+        that was actually scheduled is available to render() as
+        self._frame_period_ms.
+
+        Returns:
+            Delay in milliseconds
+        """
+        return self.FRAME_DELAY
+
+    def _build_items(self):
+        """
+        Create the canvas items this screensaver draws with.
+
+        Called from start() before the first frame if no items exist yet, so a
+        stopped screensaver keeps its items when restarted. Screensavers that use
+        canvas items should create them here, record their ids in self._items,
+        and update them in place from render() rather than recreating them.
+        """
+        pass
+
+    def _itemconfig_fill(self, item_id, color):
+        """
+        Set the fill color of a canvas item with a direct Tcl call.
+
+        Equivalent to canvas.itemconfig(item_id, fill=color), but skips tkinter's
+        option parsing, which adds up for items recolored every frame.
+
+        Args:
+            item_id: Canvas item id
+            color: Tk color string
+        """
+        self._tk_call(self._cw, "itemconfigure", item_id, "-fill", color)
+
+    def _on_configure(self, event):
+        """
+        Cache the canvas size, so frames never have to query it from Tk.
+
+        Args:
+            event: The <Configure> event, or None to read the current size
+        """
+        if event is None:
+            width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        else:
+            width, height = event.width, event.height
+        if width == self._width and height == self._height:
+            return
+
+        self._width = width
+        self._height = height
+        self._on_resize()
+
+    def _on_resize(self):
+        """
+        Adapt to a new canvas size, available as self._width and self._height.
+
+        Called whenever the cached size changes, including when start() first
+        reads it. The default implementation does nothing.
+        """
+        pass
+
     def start(self):
         """Start the screensaver animation."""
         if not self.is_running:
             self.is_running = True
+            self._next_tick_ns = None
+            self._frame_period_ms = self.FRAME_DELAY
+            self._tk_call = self.canvas.tk.call
+            self._cw = self.canvas._w
+            if self._ticker is None:
+                self._ticker = _Ticker(self.canvas, self._animate)
+
+            # Track canvas size on resize instead of querying it every frame
+            self._configure_bind = self.canvas.bind("<Configure>", self._on_configure)
+            self._on_configure(None)
+            if not self._items:
+                self._build_items()
             self._animate()
 
     def stop(self):
-        """Stop the screensaver animation."""
+        """Stop the screensaver animation, leaving its canvas items in place."""
         self.is_running = False
-        if self.animation_id:
-            self.canvas.after_cancel(self.animation_id)
-            self.animation_id = None
+        if self._ticker:
+            self._ticker.cancel()
+        # Passing the command id lets tkinter delete the Tcl command, which would
+        # otherwise keep this screensaver alive for as long as the canvas exists
+        if self._configure_bind:
+            self.canvas.unbind("<Configure>", self._configure_bind)
+            self._configure_bind = None
+
+    def destroy(self):
+        """Delete the canvas items created by this screensaver."""
+        for item_id in self._items.values():
+            self.canvas.delete(item_id)
+        self._items.clear()
 
     def cleanup(self):
         """Clean up resources before switching screensavers."""
         self.stop()
-        self.canvas.delete("all")
+        self.destroy()
 
     def _animate(self):
-        """Internal animation loop."""
-        if self.is_running:
-            self.render()
-            # Schedule next frame (approximately 40 FPS for balanced smooth animations)
-            self.animation_id = self.canvas.after(25, self._animate)
+        """
+        Internal animation loop.
+
+        stop() cancels the pending call, so this only runs while started.
+        """
+        self.render()
+        if not self.is_running:
+            return  # Stopped from within render(); its cancel missed this call
+
+        # Schedule against absolute integer deadlines, so render time and
+        # timer rounding shift individual frames but never accumulate
+        self._frame_period_ms = self.get_frame_delay()
+        period = self._frame_period_ms * 1_000_000
+        now = time.perf_counter_ns()
+        if (self._next_tick_ns is None
+                or now > self._next_tick_ns + self.MAX_FRAMES_BEHIND * period):
+            # First frame, or far behind (e.g. after a suspend): don't catch up
+            self._next_tick_ns = now
+        self._next_tick_ns += period
+        delay = (self._next_tick_ns - now) // 1_000_000
+
+        # An overrun frame (delay under 1 ms) runs again once Tk is idle rather
+        # than after a timer, so pending input and redraws (like Escape) go
+        # first. If rendering keeps taking longer than a frame the frame rate
+        # drops, but the UI stays responsive
+        self._ticker.schedule(delay)
 
 
 class ScreensaverRegistry:
     """
     Registry to manage available screensaver types.
     Screensavers register themselves here to be discovered by the main application.
+
+    Screensavers can also be registered lazily by name and module, so their
+    module is only imported when the screensaver is first requested.
     """
 
-    _screensavers = []
+    _names = []  # Display names in registration order, loaded or not
+    _screensavers = {}  # Display name -> registered class
+    _lazy = {}  # Display name -> module name, until the module registers its class
+    _snapshot = None  # Cached tuple of classes, rebuilt after the registry changes
 
     @classmethod
     def register(cls, screensaver_class):
         """
         Register a screensaver class.
 
+        A class registered under the same name as an earlier one replaces it.
+
         Args:
             screensaver_class: A class that inherits from ScreensaverBase
         """
         if not issubclass(screensaver_class, ScreensaverBase):
             raise ValueError(f"{screensaver_class} must inherit from ScreensaverBase")
-        cls._screensavers.append(screensaver_class)
+        name = screensaver_class.get_name()
+        module_name = screensaver_class.__module__
+        if name not in cls._lazy and module_name in cls._lazy.values():
+            raise ValueError(
+                f"{screensaver_class.__name__} is named {name!r}, but module {module_name} "
+                f"was registered lazily under a different name"
+            )
+
+        if name not in cls._screensavers and name not in cls._lazy:
+            cls._names.append(name)
+        cls._lazy.pop(name, None)
+        cls._screensavers[name] = screensaver_class
+        cls._snapshot = None
         return screensaver_class
 
+    @classmethod
+    def register_lazy(cls, name, module_name):
+        """
+        Register a screensaver by name without importing its module yet.
+
+        Args:
+            name: Display name the screensaver class returns from get_name()
+            module_name: Module that registers the class when imported
+        """
+        if name not in cls._screensavers and name not in cls._lazy:
+            cls._names.append(name)
+            cls._lazy[name] = module_name
+            cls._snapshot = None
+
+    @classmethod
+    def get_names(cls):
+        """
+        Get the names of all registered screensavers without loading them.
+
+        Returns:
+            Tuple of display names in registration order
+        """
+        return tuple(cls._names)
+
+    @classmethod
+    def get(cls, name):
+        """
+        Look up a registered screensaver class by its display name.
+
+        Lazily registered screensavers are imported on first lookup.
+
+        Args:
+            name: Name returned by the class's get_name()
+
+        Returns:
+            The screensaver class, or None if no screensaver has that name
+        """
+        module_name = cls._lazy.get(name)
+        if module_name is not None:
+            importlib.import_module(module_name)
+            if name not in cls._screensavers:
+                raise ValueError(f"Module {module_name} did not register a screensaver named {name!r}")
+        return cls._screensavers.get(name)
+
     @classmethod
     def get_all(cls):
         """
-        Get all registered screensaver classes.
+        Get all registered screensaver classes, loading any lazy ones.
 
         Returns:
-            List of screensaver classes
+            Tuple of screensaver classes in registration order
         """
-        return cls._screensavers.copy()
+        if cls._snapshot is None:
+            cls._snapshot = tuple(cls.get(name) for name in cls._names)
+        return cls._snapshot
 
     @classmethod
     def clear(cls):
         """Clear all registered screensavers (useful for testing)."""
+        cls._names.clear()
         cls._screensavers.clear()
+        cls._lazy.clear()
+        cls._snapshot = None